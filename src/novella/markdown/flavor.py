@@ -1,7 +1,7 @@
 
 import abc
 import dataclasses
-import os
+import typing as t
 from pathlib import Path
 
 
@@ -35,18 +35,22 @@ class MkDocsFlavor(MarkdownFlavor):
 
   prefix: str = ''
 
+  #: Cache for #get_header_id(), as the same headers are usually linked to many times.
+  _header_ids: t.Dict[str, str] = dataclasses.field(default_factory=dict, init=False, repr=False, compare=False)
+
   def get_header_id(self, header_level: int, header_text: str) -> str:
-    from markdown.extensions.toc import slugify
-    return slugify(header_text.lower(), '-')
+    header_id = self._header_ids.get(header_text)
+    if header_id is None:
+      from markdown.extensions.toc import slugify
+      header_id = self._header_ids[header_text] = slugify(header_text.lower(), '-')
+    return header_id
 
   def get_link_to_page(self, source_page: Path, target_page: Path) -> str:
     assert not source_page.is_absolute(), source_page
     assert not target_page.is_absolute(), target_page
+    url_path = target_page.as_posix()
     if target_page.name == 'index.md':
-      target_page = target_page.parent
-    else:
-      target_page = target_page.with_suffix('')
-    url_path = str(target_page).replace(os.sep, '/')
-    if url_path == os.curdir:
-      url_path = ''
+      url_path = url_path[:-len('index.md')].rstrip('/')
+    elif target_page.suffix:
+      url_path = url_path[:-len(target_page.suffix)]
     return f'/{self.prefix}{url_path}'
@@ -6,6 +6,7 @@ import re
 import dataclasses
 import hashlib
 import importlib
+import logging
 import typing as t
 import typing_extensions as te
 from pathlib import Path
@@ -17,6 +18,8 @@ from novella.novella import NovellaContext
 
 _Closure: te.TypeAlias = 't.Callable[[MarkdownPreprocessor], t.Any]'
 
+logger = logging.getLogger(__name__)
+
 
 @dataclasses.dataclass
 class MarkdownFile:
@@ -65,8 +68,17 @@ class MarkdownPreprocessorAction(Action):
   #: The encoding to read and write files as.
   encoding: str | None = None
 
+  #: Reuse the output of the previous execution if the pipeline is re-executed (e.g. with `--serve`) and none of
+  #: the Markdown files changed. Only enable this if the output of the preprocessors depends on nothing but the
+  #: Markdown files, i.e. not if you include other files with `@cat` or generate content from source code.
+  #: The cache key covers the names of the registered preprocessors but not their configuration (e.g. the flavor
+  #: or #AnchorTagProcessor.always_render_anchor_elements of the `anchor` processor), so reconfiguring a
+  #: preprocessor between executions does not invalidate the cache.
+  cache: bool = False
+
   def __post_init__(self) -> None:
     self._updaters: list[t.Callable] = []
+    self._cache: tuple[str, dict[Path, str]] | None = None
     self._processors = Graph['MarkdownPreprocessor']()
     self.use('shell')
     self.use('cat')
@@ -133,6 +145,17 @@ class MarkdownPreprocessorAction(Action):
 
     return files[0].content
 
+  def _get_cache_key(self, files: MarkdownFiles) -> str:
+    """ Returns a hash of the preprocessors and the paths and contents of the *files*. """
+
+    hasher = hashlib.sha256()
+    for name in self._processors.nodes:
+      hasher.update(name.encode() + b'\0')
+    for file in sorted(files, key=lambda f: f.output_path):
+      hasher.update(str(file.output_path).encode() + b'\0')
+      hasher.update(hashlib.sha256(file.content.encode()).digest())
+    return hasher.hexdigest()
+
   # Action
 
   def execute(self, build: BuildContext) -> None:
@@ -157,6 +180,14 @@ class MarkdownPreprocessorAction(Action):
         if file.changed():
           file.output_path.write_text(file.content, self.encoding)
 
+    cache_key = self._get_cache_key(files) if self.cache else None
+    if cache_key is not None and self._cache is not None and self._cache[0] == cache_key:
+      logger.info('Markdown files are unchanged, reusing the previous output')
+      for file in files:
+        file.content = self._cache[1][file.output_path]
+      _commit_files()
+      return
+
     for preprocessor in self._processors.nodes.values():
       preprocessor.setup()
 
@@ -177,6 +208,9 @@ class MarkdownPreprocessorAction(Action):
 
     _commit_files()
 
+    if cache_key is not None:
+      self._cache = (cache_key, {file.output_path: file.content for file in files})
+
 
 class MarkdownPreprocessor(Node['MarkdownPreprocessor']):
   """ Interface for plugins to process markdown files. """
@@ -35,6 +35,9 @@ import typing_extensions as te
 #: the strings will be concatenated by newlines.
 ReplacementFunc: te.TypeAlias = 't.Callable[[Tag], str | t.Iterable[str] | None]'
 
+_BLOCK_TAG_PATTERN = re.compile(r'^@([\w_\-]+)')
+_INDENT_PATTERN = re.compile(r'^(\s+)')
+
 
 class Tag(t.NamedTuple):
   name: str
@@ -55,6 +58,9 @@ def parse_inline_tags(content: str) -> t.Iterator[Tag]:
       {@mytag arguments here \\} :with key = "value"}
   """
 
+  if '{@' not in content:
+    return
+
   from io import StringIO
   from nr.util.parsing import Scanner
 
@@ -117,7 +123,13 @@ def parse_inline_tags(content: str) -> t.Iterator[Tag]:
     pos = scanner.pos
     match = scanner.match(TAG_BEGIN)
     if not match:
-      scanner.next()
+      # Skip ahead to the next possible tag instead of stepping through the text one character at a time.
+      index = content.find('{@', pos.offset + 1)
+      if index < 0:
+        break
+      if content[index - 1] == '\\' and index - 1 > pos.offset:
+        index -= 1
+      scanner.seek(index - pos.offset, 'cur')
       continue
 
     if match.group(0).startswith('\\'):
@@ -173,7 +185,7 @@ def parse_block_tags(content: str | t.Sequence[str]) -> t.Iterator[Tag]:
       lines.advance()
       continue
 
-    match = re.match(r'^@([\w_\-]+)', line)
+    match = _BLOCK_TAG_PATTERN.match(line) if line.startswith('@') else None
     if not match:
       lines.advance()
       continue
@@ -186,7 +198,7 @@ def parse_block_tags(content: str | t.Sequence[str]) -> t.Iterator[Tag]:
     while lines.has_next() and not line.endswith('@') and (line := lines.next()):
       if not line.strip():
         break
-      match = re.match(r'^(\s+)', line)
+      match = _INDENT_PATTERN.match(line)
       if not match or (indent is not None and len(match.group(1)) < indent):
         break
       if indent is None:
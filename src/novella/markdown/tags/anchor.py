@@ -5,7 +5,6 @@ import logging
 import re
 import typing as t
 from pathlib import Path
-from novella.build import BuildContext
 
 from novella.markdown.preprocessor import MarkdownFile, MarkdownFiles, MarkdownPreprocessor
 
@@ -53,6 +52,10 @@ class AnchorTagProcessor(MarkdownPreprocessor):
   def process_files(self, files: MarkdownFiles) -> None:
     from novella.markdown.tagparser import replace_tags, parse_block_tags, parse_inline_tags
 
+    # Index the page path of every file relative to the content directory once instead of on every link.
+    content_directory = self.action.context.project_directory / (self.action.path or '')
+    self._page_index: dict[Path, Path] = {file.path: file.path.relative_to(content_directory) for file in files}
+
     # Replace anchor tags and build the anchor index.
     self._anchor_index: dict[str, Anchor] = {}
     for file in files:
@@ -62,7 +65,7 @@ class AnchorTagProcessor(MarkdownPreprocessor):
     # Replace link tags.
     for file in files:
       tags = [t for t in parse_inline_tags(file.content) if t.name == 'link']
-      file.content = replace_tags(file.content, tags, lambda t: self._replace_link(files.build, file, t))
+      file.content = replace_tags(file.content, tags, lambda t: self._replace_link(file, t))
 
   def _replace_anchor(self, file: MarkdownFile, tag: Tag) -> str | None:
     # Find the next Markdown header that immediately follows the tag.
@@ -93,25 +96,26 @@ class AnchorTagProcessor(MarkdownPreprocessor):
 
     return ''
 
-  def _replace_link(self, build: BuildContext, file: MarkdownFile, tag: Tag) -> str | None:
+  def _replace_link(self, file: MarkdownFile, tag: Tag) -> str | None:
     anchor_id = tag.args.strip()
     anchor = self._anchor_index.get(anchor_id)
     if not anchor:
       return f'{{@link {anchor_id}}}'
 
-    source_page = file.output_path.relative_to(build.directory / (self.action.path or ''))
-    target_page = anchor.file.relative_to(self.action.context.project_directory / (self.action.path or ''))
+    flavor = self.flavor
+    page = file.path
 
-    if source_page != target_page:
-      href = self.flavor.get_link_to_page(source_page, target_page)
-    else:
+    # Links within the same page usually share the path object with the anchor, so try the cheap identity check first.
+    if anchor.file is page or anchor.file == page:
       href = ''
+    else:
+      href = flavor.get_link_to_page(self._page_index[page], self._page_index[anchor.file])
     if self.always_render_anchor_elements or not anchor.header_text:
       href += '#' + anchor.id
     else:
       assert anchor.header_level
-      href += '#' + self.flavor.get_header_id(anchor.header_level, anchor.header_text)
+      href += '#' + flavor.get_header_id(anchor.header_level, anchor.header_text)
 
     text = tag.options.get('text', None) or anchor.text or anchor.header_text
     assert text is not None, anchor
-    return self.flavor.render_link(text, href)
+    return flavor.render_link(text, href)
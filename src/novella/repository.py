@@ -2,6 +2,7 @@
 from __future__ import annotations
 
 import enum
+import functools
 import typing as t
 from pathlib import Path
 
@@ -19,30 +20,44 @@ class RepositoryDetails(t.NamedTuple):
   branch: str | None
 
 
+@functools.lru_cache(maxsize=16)
 def detect_repository(path: Path) -> RepositoryDetails | None:
   """ Detects the repository details from the given path.
 
-  Currently supports only Git repositories. Does a simplistic attempt to convert SSH URLs to HTTPS.
+  Currently supports only Git repositories. Does a simplistic attempt to convert SSH URLs to HTTPS. The result is
+  cached per *path* for the lifetime of the process; use `detect_repository.cache_clear()` to reset it.
   """
 
-  from nr.util.git import Git, NoCurrentBranchError
-
-  git = Git(path)
-  if not (toplevel := git.get_toplevel()):
+  import subprocess as sp
+
+  # Get the toplevel directory and the current branch name in a single Git invocation. In a repository without
+  # commits, Git prints both and then fails to resolve `HEAD`, which is fine because we only need the output.
+  rev_parse = sp.run(
+    ['git', 'rev-parse', '--show-toplevel', '--abbrev-ref', 'HEAD'],
+    cwd=path,
+    stdout=sp.PIPE,
+    stderr=sp.DEVNULL,
+    universal_newlines=True,
+  ).stdout.splitlines()
+  if not rev_parse:
     return None
-
-  remote = next(iter(git.remotes()), None)
-  if not remote:
+  toplevel = rev_parse[0]
+  branch = rev_parse[1] if len(rev_parse) > 1 and rev_parse[1] != 'HEAD' else None
+
+  # The first line of `git remote -v` is the fetch URL of the first remote, formatted as `<name>\t<url> (fetch)`.
+  remotes = sp.run(
+    ['git', 'remote', '-v'],
+    cwd=path,
+    stdout=sp.PIPE,
+    stderr=sp.DEVNULL,
+    universal_newlines=True,
+  ).stdout.splitlines()
+  if not remotes:
     return None
 
-  url = remote.fetch
+  url = remotes[0].partition('\t')[2].rpartition(' ')[0]
   if url.startswith('git@'):
     url = 'https://' + url[4:].replace(':', '/')
   url = removesuffix(url, '.git')
 
-  try:
-    branch = git.get_current_branch_name()
-  except NoCurrentBranchError:
-    branch = None
-
   return RepositoryDetails(RepositoryType.GIT, Path(toplevel), url, branch)
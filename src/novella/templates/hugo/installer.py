@@ -2,6 +2,7 @@
 import logging
 import os
 import platform
+import re
 import requests
 import shutil
 import subprocess as sp
@@ -14,6 +15,15 @@ from nr.util.fs import chmod
 
 logger = logging.getLogger(__name__)
 
+#: Matches a single `<url>; rel="name"` entry of a `Link` HTTP header. Other parameters may precede `rel`.
+_LINK_PATTERN = re.compile(r'<([^>]*)>[^,<]*?;\s*rel\s*=\s*"?([^",;]*)"?')
+
+#: Shared session so that connections to GitHub are kept alive across paginated requests and the download.
+_session = requests.Session()
+
+#: The buffer size for downloading the Hugo archive. The archive is tens of megabytes large.
+_CHUNK_SIZE = 1024 * 1024
+
 
 def get_installed_hugo_version() -> t.Optional[str]:
   """
@@ -80,15 +90,21 @@ def install_hugo(to: str, version: t.Optional[str] = None, extended: bool = True
 
   logger.info('Downloading Hugo v%s from "%s"', version, files[filename])
   os.makedirs(os.path.dirname(to), exist_ok=True)
-  with tempfile.TemporaryDirectory() as tempdir:
+  # Create the temporary directory next to the destination so the binary can be moved into place atomically.
+  with tempfile.TemporaryDirectory(dir=os.path.dirname(to)) as tempdir:
     path = os.path.join(tempdir, filename)
-    with open(path, 'wb') as fp:
-      shutil.copyfileobj(requests.get(files[filename], stream=True).raw, fp)
+    with open(path, 'wb', buffering=_CHUNK_SIZE) as fp:
+      shutil.copyfileobj(_session.get(files[filename], stream=True).raw, fp, _CHUNK_SIZE)
     with tarfile.open(path) as archive:
-      with open(to, 'wb') as fp:
-        shutil.copyfileobj(  # type: ignore[misc]  # See https://github.com/python/mypy/issues/15031
-          t.cast(t.IO[bytes], archive.extractfile('hugo')),
-          t.cast(t.IO[bytes], fp))
+      if hasattr(tarfile, 'data_filter'):
+        # The 'data' filter drops the owner recorded in the archive and silences the Python 3.12+ warning.
+        archive.extract('hugo', path=tempdir, filter='data')
+      else:
+        with open(os.path.join(tempdir, 'hugo'), 'wb') as fp:
+          shutil.copyfileobj(  # type: ignore[misc]  # See https://github.com/python/mypy/issues/15031
+            t.cast(t.IO[bytes], archive.extractfile('hugo')),
+            t.cast(t.IO[bytes], fp))
+    os.replace(os.path.join(tempdir, 'hugo'), to)
 
   chmod.update(to, '+x')
   logger.info('Hugo v%s installed to "%s"', version, to)
@@ -99,7 +115,7 @@ def get_github_releases(repo: str) -> t.Generator[dict, None, None]:
 
   url: t.Optional[str] = 'https://api.github.com/repos/{}/releases'.format(repo)
   while url:
-    response = requests.get(url)
+    response = _session.get(url)
     link = response.headers.get('Link')
     assert link
     links = parse_links_header(link)
@@ -108,26 +124,6 @@ def get_github_releases(repo: str) -> t.Generator[dict, None, None]:
 
 
 def parse_links_header(link_header: str) -> t.Dict[str, str]:
-  """ Parses the `Link` HTTP header and returns a map of the links. Logic from
-  [PageLinks.java](https://github.com/eclipse/egit-github/blob/master/org.eclipse.egit.github.core/src/org/eclipse/egit/github/core/client/PageLinks.java#L43-75).
-  """
+  """ Parses the `Link` HTTP header and returns a map of the links, keyed by their `rel` parameter. """
 
-  links = {}
-
-  for link in link_header.split(','):
-    segments = link.split(';')
-    if len(segments) < 2:
-      continue
-    link_part = segments[0].strip()
-    if not link_part.startswith('<') or not link_part.endswith('>'):
-      continue
-    link_part = link_part[1:-1]
-    for rel in (x.strip().split('=') for x in segments[1:]):
-      if len(rel) < 2 or rel[0] != 'rel':
-        continue
-      rel_value = rel[1]
-      if rel_value.startswith('"') and rel_value.endswith('"'):
-        rel_value = rel_value[1:-1]
-      links[rel_value] = link_part
-
-  return links
+  return {rel: url for url, rel in _LINK_PATTERN.findall(link_header)}
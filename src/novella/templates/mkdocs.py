@@ -1,29 +1,40 @@
 
 from __future__ import annotations
 
-import dataclasses
+import copy
 import logging
-import os
 import re
 import textwrap
+import types
 import typing as t
+from pathlib import Path
 
+import yaml
 from nr.util.singleton import NotSet
 
 from novella.action import Action
-from novella.build import BuildContext
-from novella.markdown.flavor import MkDocsFlavor
-from novella.novella import NovellaContext
 from novella.template import Template
 from novella.repository import detect_repository
 
 if t.TYPE_CHECKING:
   from novella.action import CopyFilesAction, RunAction
+  from novella.build import BuildContext
+  from novella.novella import NovellaContext
   from novella.markdown.tags.anchor import AnchorTagProcessor
   from novella.markdown.preprocessor import MarkdownPreprocessorAction
 
 logger = logging.getLogger(__name__)
 
+# The configuration is dumped with the full dumper so that Python objects (e.g. the `emoji_index` function of
+# `pymdownx.emoji`) are written as `!!python/name:` tags, which MkDocs understands.
+try:
+  from yaml import CSafeLoader as _SafeLoader, CDumper as _Dumper
+except ImportError:
+  from yaml import SafeLoader as _SafeLoader, Dumper as _Dumper  # type: ignore[assignment]
+
+#: Matches the tabs with configuration profiles in the #MkdocsUpdateConfigAction docstring.
+_PROFILE_PATTERN = re.compile(r'===\s*"([^"]+)"\s+```\w+(.*?)```', re.M | re.S)
+
 
 class MkdocsTemplate(Template):
   """ A template to bootstrap an MkDocs build using Novella. It will set up actions to copy files from the
@@ -93,20 +104,38 @@ class MkdocsTemplate(Template):
     preprocessor = t.cast('MarkdownPreprocessorAction', context.do('preprocess-markdown', name='preprocess-markdown'))
     preprocessor.path = self.content_directory
     def configure_anchor(anchor: AnchorTagProcessor) -> None:
+      from novella.markdown.flavor import MkDocsFlavor
       anchor.flavor = MkDocsFlavor(t.cast('str | None', context.options['base-url']) or self.base_url or '')
     context.delay(lambda: preprocessor.preprocessor('anchor', t.cast(t.Any, configure_anchor)))
 
     def configure_run(run: RunAction) -> None:
+      options = context.options
       run.args = [ "mkdocs" ]
-      if context.options["serve"]:
-        port = int(str(context.options["port"]))
+      if options["serve"]:
+        port = int(str(options["port"]))
         run.supports_reloading = True
         run.args += [ "serve", "--dev-addr", f"localhost:{port}" ]
       else:
-        run.args += [ "build", "-d", context.project_directory / str(context.options["site-dir"]) ]
+        run.args += [ "build", "-d", context.project_directory / str(options["site-dir"]) ]
     context.do('run', configure_run, name='mkdocs-run')
 
 
+class _ConfigUpdate(t.NamedTuple):
+  """ An update registered with #MkdocsUpdateConfigAction.update(). """
+
+  #: The keys leading up to the container of the value that is updated.
+  path: tuple[str, ...]
+
+  #: The key of the value to update in its container.
+  key: str
+
+  #: The operation, i.e. which of the `add`, `set` or `do` arguments was passed to #update().
+  op: t.Literal['add', 'set', 'do']
+
+  #: The value of the argument.
+  value: t.Any
+
+
 class MkdocsUpdateConfigAction(Action):
   """ An action to update the MkDocs configuration file, or create one if the user did not provide it.
 
@@ -175,6 +204,7 @@ class MkdocsUpdateConfigAction(Action):
   """
 
   _profiles: t.ClassVar[t.Optional[t.Dict[str, str]]] = None
+  _profile_configs: t.ClassVar[t.Optional[t.Dict[str, t.Mapping[str, t.Any]]]] = None
 
   #: Whether to apply the template to the MkDocs configuration (shown above).
   #:
@@ -202,13 +232,24 @@ class MkdocsUpdateConfigAction(Action):
     if cls._profiles is None:
       assert cls.__doc__
       profiles = {}
-      pattern = re.compile(r'===\s*"([^"]+)"\s+```\w+(.*?)```', re.M | re.S)
-      for match in re.finditer(pattern, cls.__doc__):
+      for match in _PROFILE_PATTERN.finditer(cls.__doc__):
         profiles[match.group(1).upper()] = textwrap.dedent(match.group(2))
       assert profiles
       cls._profiles = profiles
     return cls._profiles[name.upper()]
 
+  @classmethod
+  def _get_profile_config(cls, name: str) -> t.Mapping[str, t.Any]:
+    """ Returns the parsed configuration of the profile with the given *name*. Profiles are parsed only once, the
+    returned mapping is read-only and nested values must be copied before they are modified. """
+
+    if cls._profile_configs is None:
+      cls._profile_configs = {}
+    key = name.upper()
+    if key not in cls._profile_configs:
+      cls._profile_configs[key] = types.MappingProxyType(yaml.load(cls._get_profile(name), Loader=_SafeLoader))
+    return cls._profile_configs[key]
+
   def update(self, json_path: str, *, add: t.Any = NotSet.Value, set: t.Any = NotSet.Value, do: t.Callable[[t.Any], t.Any] | None = None) -> None:
     """ A helper function to update a value in the MkDocs configuration by either setting it to the
     value specified to the *set* argument or by adding to it (e.g. updating it if it is a dictionary
@@ -233,64 +274,126 @@ class MkdocsUpdateConfigAction(Action):
     ```
     """
 
-    arg_count = sum([add is not NotSet.Value, set is not NotSet.Value, do is not None])
-    if arg_count == 0:
+    has_add = add is not NotSet.Value
+    has_set = set is not NotSet.Value
+    has_do = do is not None
+    if not (has_add or has_set or has_do):
       raise ValueError('missing "add", "set" or "do" argument')
-    elif arg_count > 1:
+    elif has_add + has_set + has_do > 1:
       raise ValueError('incompatible arguments')
 
     parts = json_path.split('.')
     if parts[0] != '$':
       raise ValueError(f'invalid json_path, must begin with `$.`: {json_path!r}')
 
-    def _mutator(config: dict[str, t.Any]) -> None:
-      for part in parts[1:-1]:
-        if part not in config:
-          config[part] = {}
-        config = config[part]
-      part = parts[-1]
-      if do is not None:
-        do(config[part])
-      elif part not in config or set is not NotSet.Value:
-        config[part] = add if set is NotSet.Value else set
-      else:
-        if isinstance(config[part], dict):
-          config[part] = {**config[part], **add}
-        else:
-          config[part] = config[part] + add
-
-    self._updaters.append(_mutator)
+    if has_do:
+      update = _ConfigUpdate(tuple(parts[1:-1]), parts[-1], 'do', do)
+    elif has_set:
+      update = _ConfigUpdate(tuple(parts[1:-1]), parts[-1], 'set', set)
+    else:
+      update = _ConfigUpdate(tuple(parts[1:-1]), parts[-1], 'add', add)
+    self._updaters.append(update)
 
   def update_with(self, func: t.Callable[[dict[str, t.Any]], t.Any]) -> None:
     """ Adds a callback that can modify the MkDocs config before it is updated. """
 
     self._updaters.append(func)
 
+  def _apply_updaters(self, config: dict[str, t.Any]) -> None:
+    """ Applies the updates registered with #update() and #update_with() in order. The parent containers of the
+    values updated via #update() are looked up once and reused by subsequent updates below the same path. """
+
+    parents: dict[tuple[str, ...], dict[str, t.Any]] = {}
+
+    def get_parent(path: tuple[str, ...]) -> dict[str, t.Any]:
+      if not path:
+        return config
+      if path not in parents:
+        parents[path] = get_parent(path[:-1]).setdefault(path[-1], {})
+      return parents[path]
+
+    for updater in self._updaters:
+      if not isinstance(updater, _ConfigUpdate):
+        updater(config)
+        parents.clear()
+        continue
+
+      parent, key, op, value = get_parent(updater.path), updater.key, updater.op, updater.value
+      if op == 'do':
+        value(parent[key])
+      elif op == 'set' or key not in parent:
+        parent[key] = value
+      elif isinstance(parent[key], dict):
+        parent[key] = {**parent[key], **value}
+      else:
+        parent[key] = parent[key] + value
+
+      # Containers at or below the updated key may have been replaced.
+      prefix = updater.path + (key,)
+      for path in [path for path in parents if path[:len(prefix)] == prefix]:
+        del parents[path]
+
+  def _get_settings(self) -> tuple[t.Any, ...]:
+    """ Returns the settings that affect the generated configuration, to detect if they changed between runs. """
+
+    return (
+      self.apply_defaults,
+      self.profile,
+      self.site_name,
+      self.autodetect_repo_url,
+      self.content_directory,
+      tuple(self._updaters),
+    )
+
+  def _has_callable_updaters(self) -> bool:
+    """ Returns `True` if any updater calls user code (#update_with() or #update() with `do`), the result of which
+    may change between executions even if the settings did not. """
+
+    return any(not isinstance(updater, _ConfigUpdate) or updater.op == 'do' for updater in self._updaters)
+
   # Action
 
   def __post_init__(self) -> None:
-    self._updaters: list[t.Callable] = []
+    self._updaters: list[_ConfigUpdate | t.Callable[[dict[str, t.Any]], t.Any]] = []
 
-  def execute(self, build: BuildContext) -> None:
-    import copy
-    import yaml
+    #: The path, modification time and size of the configuration file and the action's settings after the last
+    #: execution.
+    self._last_state: tuple[Path, int, int, tuple[t.Any, ...]] | None = None
 
-    mkdocs_config = {}
+  def execute(self, build: BuildContext) -> None:
+    # When the pipeline is re-executed (e.g. with `--serve`) and the configuration file in the build directory is
+    # still the one produced by the previous execution, it is already up to date. Callbacks are always re-run as
+    # their output may depend on something else than the configuration (e.g. the content directory).
+    settings = self._get_settings()
+    if self._last_state is not None and not self._has_callable_updaters():
+      last_path, last_mtime, last_size, last_settings = self._last_state
+      try:
+        stat = last_path.stat()
+        if stat.st_mtime_ns == last_mtime and stat.st_size == last_size and last_settings == settings:
+          logger.debug('Skipping unchanged <fg=yellow>%s</fg>', last_path)
+          return
+      except FileNotFoundError:
+        pass
+
+    mkdocs_config: dict[str, t.Any] = {}
+    original_data = b''
+    existed = False
 
     for extension in ['yml', 'yaml']:
       mkdocs_yml = build.directory / f'mkdocs.{extension}'
 
-      if mkdocs_yml.exists():
-        mkdocs_config = yaml.safe_load(mkdocs_yml.read_text())
-        break
-
-    original_config = copy.deepcopy(mkdocs_config)
+      try:
+        original_data = mkdocs_yml.read_bytes()
+      except FileNotFoundError:
+        continue
+      mkdocs_config = yaml.load(original_data, Loader=_SafeLoader) or {}
+      existed = True
+      break
 
     if self.apply_defaults and self.profile:
-      default_config = yaml.safe_load(self._get_profile(self.profile))
-      for key in default_config:
+      for key, value in self._get_profile_config(self.profile).items():
         if key not in mkdocs_config:
-          mkdocs_config[key] = default_config[key]
+          mkdocs_config[key] = copy.deepcopy(value)
 
     if self.site_name:
       mkdocs_config['site_name'] = self.site_name
@@ -298,22 +401,30 @@ class MkdocsUpdateConfigAction(Action):
     if self.content_directory:
       mkdocs_config['docs_dir'] = self.content_directory
 
-    if self.autodetect_repo_url:
+    # Detecting the repository runs Git, so only do it if there is anything left to fill in.
+    needs_repo_url = 'repo_url' not in mkdocs_config
+    needs_edit_uri = 'edit_uri' not in mkdocs_config
+    if self.autodetect_repo_url and (needs_repo_url or needs_edit_uri):
       repo_info = detect_repository(self.context.project_directory)
-      if 'repo_url' not in mkdocs_config and repo_info:
+      if not repo_info:
+        logger.warning('Could not detect Git repository URL')
+      else:
+        if needs_repo_url:
           mkdocs_config['repo_url'] = repo_info.url
           logger.info('Detected Git repository URL: <fg=cyan>%s</fg>', repo_info.url)
-      else:
-        logger.warning('Could not detect Git repository URL')
-      if 'edit_uri' not in mkdocs_config and repo_info:
-        content_dir = (self.context.project_directory / self.content_directory)
-        edit_uri = f'blob/{repo_info.branch}/' + str(content_dir.relative_to(repo_info.root))
-        mkdocs_config['edit_uri'] = edit_uri
-        logger.info('Detected edit URI: <fg=cyan>%s</fg>', edit_uri)
-
-    for mutator in self._updaters:
-      mutator(mkdocs_config)
-
-    if original_config != mkdocs_config:
-      logger.info('%s <fg=yellow>%s</fg>', 'Updating' if mkdocs_yml.exists() else 'Generating new', mkdocs_yml)
-      mkdocs_yml.write_text(yaml.dump(mkdocs_config))
+        if needs_edit_uri:
+          content_dir = (self.context.project_directory / self.content_directory)
+          edit_uri = f'blob/{repo_info.branch}/' + content_dir.relative_to(repo_info.root).as_posix()
+          mkdocs_config['edit_uri'] = edit_uri
+          logger.info('Detected edit URI: <fg=cyan>%s</fg>', edit_uri)
+
+    self._apply_updaters(mkdocs_config)
+
+    # Compare the serialized configuration instead of keeping a deep copy of the original around.
+    new_data = yaml.dump(mkdocs_config, Dumper=_Dumper, encoding='utf-8', sort_keys=False)
+    if new_data != original_data:
+      logger.info('%s <fg=yellow>%s</fg>', 'Updating' if existed else 'Generating new', mkdocs_yml)
+      mkdocs_yml.write_bytes(new_data)
+
+    stat = mkdocs_yml.stat()
+    self._last_state = (mkdocs_yml, stat.st_mtime_ns, stat.st_size, settings)
@@ -0,0 +1,104 @@
+
+from __future__ import annotations
+
+import types
+import typing as t
+from pathlib import Path
+
+from novella.build import BuildContext
+from novella.graph import Graph
+from novella.markdown.preprocessor import MarkdownFiles, MarkdownPreprocessor, MarkdownPreprocessorAction
+
+
+class _Build(BuildContext):
+
+  def __init__(self, directory: Path) -> None:
+    self._directory = directory
+
+  @property
+  def directory(self) -> Path:
+    return self._directory
+
+  def watch(self, path: Path) -> None:
+    pass
+
+  def is_aborted(self) -> bool:
+    return False
+
+  def on_abort(self, callback: t.Callable[[], t.Any]) -> None:
+    pass
+
+  def notify(self, action, event, commit=None) -> None:
+    pass
+
+
+class _UppercaseProcessor(MarkdownPreprocessor):
+
+  def __post_init__(self) -> None:
+    self.calls = 0
+
+  def process_files(self, files: MarkdownFiles) -> None:
+    self.calls += 1
+    for file in files:
+      file.content = file.content.upper()
+
+
+def _make_action(tmp_path: Path) -> tuple[MarkdownPreprocessorAction, _UppercaseProcessor]:
+  context = types.SimpleNamespace(project_directory=tmp_path / 'project')
+  action = MarkdownPreprocessorAction(t.cast(t.Any, context), 'preprocess-markdown')
+  action._processors = Graph()
+  processor = _UppercaseProcessor(action, 'uppercase')
+  action.use(processor)
+  action.cache = True
+  return action, processor
+
+
+def test_cache_reuses_output_for_unchanged_files(tmp_path: Path):
+  action, processor = _make_action(tmp_path)
+  build = _Build(tmp_path / 'build')
+  build.directory.mkdir()
+
+  (build.directory / 'a.md').write_text('hello')
+  action.execute(build)
+  assert (build.directory / 'a.md').read_text() == 'HELLO'
+  assert processor.calls == 1
+
+  # The build directory is repopulated with the original content before the pipeline is re-executed.
+  (build.directory / 'a.md').write_text('hello')
+  action.execute(build)
+  assert (build.directory / 'a.md').read_text() == 'HELLO'
+  assert processor.calls == 1
+
+
+def test_cache_misses_on_changed_content(tmp_path: Path):
+  action, processor = _make_action(tmp_path)
+  build = _Build(tmp_path / 'build')
+  build.directory.mkdir()
+
+  (build.directory / 'a.md').write_text('hello')
+  (build.directory / 'b.md').write_text('world')
+  action.execute(build)
+  assert processor.calls == 1
+
+  (build.directory / 'a.md').write_text('hello')
+  (build.directory / 'b.md').write_text('changed')
+  action.execute(build)
+  assert (build.directory / 'b.md').read_text() == 'CHANGED'
+  assert processor.calls == 2
+
+
+def test_cache_misses_on_changed_processors(tmp_path: Path):
+  action, processor = _make_action(tmp_path)
+  build = _Build(tmp_path / 'build')
+  build.directory.mkdir()
+
+  (build.directory / 'a.md').write_text('hello')
+  action.execute(build)
+  assert processor.calls == 1
+
+  other = _UppercaseProcessor(action, 'other')
+  action.use(other)
+  (build.directory / 'a.md').write_text('hello')
+  action.execute(build)
+  assert processor.calls == 2
+  assert other.calls == 1
@@ -77,3 +77,23 @@ def test_parse_inline_tags_broken():
   assert tags == [
     Tag('link', ' to this', {}, (23, 38), (1, 1))
   ]
+
+
+def test_parse_inline_tags_escaped():
+  assert list(parse_inline_tags('a \\{@link x} b')) == []
+  assert list(parse_inline_tags('a \\\\{@link x} b')) == []
+
+
+def test_parse_inline_tags_line_span():
+  text = 'first line\nsecond {@a b}\nthird\n\nfifth {@link\n  spanning} end'
+  tags = list(parse_inline_tags(text))
+  assert text[slice(*tags[1].offset_span)] == '{@link\n  spanning}'
+  assert tags == [
+    Tag('a', ' b', {}, (18, 24), (2, 2)),
+    Tag('link', '\n  spanning', {}, (38, 56), (5, 6)),
+  ]
+
+
+def test_parse_inline_tags_without_tags():
+  assert list(parse_inline_tags('')) == []
+  assert list(parse_inline_tags('no tags here @foo { bar }')) == []
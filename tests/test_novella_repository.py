@@ -0,0 +1,84 @@
+
+from __future__ import annotations
+
+import os
+import subprocess as sp
+from pathlib import Path
+
+import pytest
+
+from novella.repository import RepositoryDetails, RepositoryType, detect_repository
+
+
+@pytest.fixture(autouse=True)
+def _isolate(tmp_path: Path, monkeypatch: pytest.MonkeyPatch):
+  # Prevent Git from picking up a repository that the temporary directory may be nested in.
+  monkeypatch.setenv('GIT_CEILING_DIRECTORIES', str(tmp_path))
+  detect_repository.cache_clear()
+  yield
+  detect_repository.cache_clear()
+
+
+def _git(cwd: Path, *args: str) -> None:
+  env = dict(os.environ, GIT_AUTHOR_NAME='Test', GIT_AUTHOR_EMAIL='test@example.org',
+    GIT_COMMITTER_NAME='Test', GIT_COMMITTER_EMAIL='test@example.org')
+  sp.run(['git', *args], cwd=cwd, env=env, check=True, stdout=sp.DEVNULL, stderr=sp.DEVNULL)
+
+
+def _init(path: Path, commit: bool = True, remote: str | None = 'https://example.org/repo.git') -> Path:
+  path.mkdir()
+  _git(path, 'init', '-q')
+  _git(path, 'symbolic-ref', 'HEAD', 'refs/heads/develop')
+  if remote:
+    _git(path, 'remote', 'add', 'origin', remote)
+  if commit:
+    _git(path, 'commit', '-q', '--allow-empty', '-m', 'Initial commit')
+  return path
+
+
+def test_detect_repository(tmp_path: Path):
+  repo = _init(tmp_path / 'repo')
+  assert detect_repository(repo) == RepositoryDetails(
+    RepositoryType.GIT, repo.resolve(), 'https://example.org/repo', 'develop')
+
+
+def test_detect_repository_from_subdirectory(tmp_path: Path):
+  repo = _init(tmp_path / 'repo')
+  (repo / 'docs').mkdir()
+  details = detect_repository(repo / 'docs')
+  assert details is not None
+  assert details.root.resolve() == repo.resolve()
+  assert details.url == 'https://example.org/repo'
+
+
+def test_detect_repository_without_commits(tmp_path: Path):
+  repo = _init(tmp_path / 'repo', commit=False)
+  details = detect_repository(repo)
+  assert details is not None
+  assert details.url == 'https://example.org/repo'
+  assert details.branch is None
+
+
+def test_detect_repository_with_detached_head(tmp_path: Path):
+  repo = _init(tmp_path / 'repo')
+  _git(repo, 'checkout', '-q', '--detach')
+  details = detect_repository(repo)
+  assert details is not None
+  assert details.branch is None
+
+
+def test_detect_repository_without_remotes(tmp_path: Path):
+  repo = _init(tmp_path / 'repo', remote=None)
+  assert detect_repository(repo) is None
+
+
+def test_detect_repository_converts_ssh_urls(tmp_path: Path):
+  repo = _init(tmp_path / 'repo', remote='git@github.com:NiklasRosenstein/novella.git')
+  details = detect_repository(repo)
+  assert details is not None
+  assert details.url == 'https://github.com/NiklasRosenstein/novella'
+
+
+def test_detect_repository_outside_of_repository(tmp_path: Path):
+  (tmp_path / 'plain').mkdir()
+  assert detect_repository(tmp_path / 'plain') is None
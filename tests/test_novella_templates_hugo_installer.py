@@ -0,0 +1,24 @@
+
+from novella.templates.hugo.installer import parse_links_header
+
+
+def test_parse_links_header():
+  header = (
+    '<https://api.github.com/repositories/11180687/releases?page=2>; rel="next", '
+    '<https://api.github.com/repositories/11180687/releases?page=10>; rel="last"'
+  )
+  assert parse_links_header(header) == {
+    'next': 'https://api.github.com/repositories/11180687/releases?page=2',
+    'last': 'https://api.github.com/repositories/11180687/releases?page=10',
+  }
+
+
+def test_parse_links_header_with_other_parameters():
+  assert parse_links_header('<https://example.org/a>; title="A"; rel=prev,<https://example.org/b>;rel="first"') == {
+    'prev': 'https://example.org/a',
+    'first': 'https://example.org/b',
+  }
+
+
+def test_parse_links_header_ignores_invalid_entries():
+  assert parse_links_header('https://example.org/a; rel="next", <https://example.org/b>') == {}
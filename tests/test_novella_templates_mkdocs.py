@@ -0,0 +1,26 @@
+
+from __future__ import annotations
+
+import os
+import types
+import typing as t
+from pathlib import Path
+
+import yaml
+
+from novella.templates.mkdocs import MkdocsUpdateConfigAction
+
+
+def test_update_config_dumps_python_objects(tmp_path: Path):
+  context = types.SimpleNamespace(project_directory=tmp_path)
+  build = types.SimpleNamespace(directory=tmp_path)
+  action = MkdocsUpdateConfigAction(t.cast(t.Any, context), 'mkdocs-update-config')
+  action.content_directory = 'content'
+  action.autodetect_repo_url = False
+  action.update('$.markdown_extensions', add=[{'pymdownx.emoji': {'emoji_index': os.path.join}}])
+  action.execute(t.cast(t.Any, build))
+
+  data = (tmp_path / 'mkdocs.yaml').read_text()
+  assert '!!python/name:' in data
+  config = yaml.unsafe_load(data)
+  assert {'pymdownx.emoji': {'emoji_index': os.path.join}} in config['markdown_extensions']